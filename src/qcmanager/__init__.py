@@ -45,9 +45,18 @@ def run_single_procedure(
             *session.detect_procedure_interface(procedure_class)
         )
         # For all the the results. The file path should be reset to be relative
-        # to the session.yaml file
+        # to the session.yaml file. Files stored under the procedure store base
+        # only require the relative path of the store base itself.
+        log_dir = os.path.dirname(session.log_file)
+        store_prefix = os.path.join(store_base, "")
+        store_relpath = os.path.relpath(store_base, log_dir)
         for f in result.data_files:
-            f.path = os.path.relpath(f.path, os.path.dirname(session.log_file))
+            if f.path.startswith(store_prefix):
+                f.path = os.path.normpath(
+                    os.path.join(store_relpath, f.path[len(store_prefix) :])
+                )
+            else:
+                f.path = os.path.relpath(f.path, log_dir)
     # Most exceptions should be handled in the _procedure_base method.
     except Exception:
         # Unlabeled exceptions. In usual operation, it should never reach this
@@ -52,8 +52,20 @@ class ZMQController:
         self._port = port
         self._config = copy.copy(config)
         # Creating the socket
-        self.socket = zmq.Context().socket(zmq.REQ)
-        self.socket.connect(f"tcp://{self._ip}:{self._port}")
+        self.socket = self._make_socket()
+
+    def _make_socket(self) -> zmq.Socket:
+        socket = zmq.Context().socket(zmq.REQ)
+        socket.connect(f"tcp://{self._ip}:{self._port}")
+        return socket
+
+    def reconnect(self) -> None:
+        """
+        Replacing the socket connection. Required if a request was sent but its
+        reply was abandoned, as the REQ socket would reject any further request.
+        """
+        self.socket.close(linger=0)
+        self.socket = self._make_socket()
 
     def socket_send(self, message: str) -> str:
         """
@@ -213,6 +225,35 @@ class DAQController(ZMQController):
         """Checking whether then run sequence is complete"""
         return not self.socket_check("run_done", "notdone")
 
+    def wait_complete(
+        self, interval: float = 0.01, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Blocking until the run sequence is complete, checking the run status
+        every interval seconds. The reply to each status request is waited on
+        by polling the socket in 100ms steps. If a timeout (in seconds) is
+        given, a RuntimeError is raised once it has passed. A socket left
+        without a reply is reconnected first so that it can still be used.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def _expired() -> bool:
+            return deadline is not None and time.monotonic() > deadline
+
+        while True:
+            self.socket.send_string("run_done")
+            while not self.socket.poll(100, zmq.POLLIN):
+                if _expired():
+                    self.reconnect()
+                    raise RuntimeError(
+                        f"No reply from DAQ server within {timeout} seconds!"
+                    )
+            if self.socket.recv().decode().lower().find("notdone") < 0:
+                return
+            if _expired():
+                raise RuntimeError(f"DAQ run not complete within {timeout} seconds!")
+            time.sleep(interval)
+
     def stop(self):
         """Ensuring the the signal has been stopped"""
         return self.socket_send("stop")
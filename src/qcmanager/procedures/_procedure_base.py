@@ -8,17 +8,16 @@ procedures, such as pulling data with a fixed number of events, and methods for
 creating the command line processes.
 """
 
+import inspect
 import io
 import logging
 import os
-import shutil
-import time
 import traceback
 from dataclasses import dataclass
-from typing import Callable, Iterable
+from typing import Any, Callable, ClassVar, Iterable, Optional, Tuple
 
 from ..hw.tileboard_zmq import TBController
-from ..utils import _str_, timestamps, to_yaml
+from ..utils import _LazyStr, move_file, timestamps, to_yaml, wait_file_stable
 from ..yaml_format import DataEntry, ProcedureResult, StatusCode
 
 
@@ -55,6 +54,22 @@ class ProcedureBase(object):
 
     store_base: str = ""
 
+    # (name, annotation) pairs of the run method interfaces, excluding self
+    _run_param_specs: ClassVar[Tuple[Tuple[str, Any], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Caching the interfaces of the run method, as the signature is fixed once
+        the procedure class has been defined.
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "run"):
+            cls._run_param_specs = tuple(
+                (name, param.annotation)
+                for name, param in inspect.signature(cls.run).parameters.items()
+                if name != "self"
+            )
+
     def __post_init__(self):
         """
         Additional items to create after all kwargs have been complete
@@ -66,6 +81,7 @@ class ProcedureBase(object):
             input={k: v for k, v in self.__dict__.items() if k != "store_base"},
             status_code=(0, ""),
         )
+        self._logger = logging.getLogger(f"QACProcedure.{self.name}")
 
     def run_with(self, *args, **kwargs) -> ProcedureResult:
         """
@@ -82,11 +98,11 @@ class ProcedureBase(object):
         except Exception as err:
             # Generic error. Supposedly it should not reach this stage. Passing
             # the full error message to logger information.
-            print(traceback.format_exc())
+            error_trace = traceback.format_exc()
+            print(error_trace)
             self.result.status_code = (StatusCode.UNKNOWN_ERROR, str(err))
             self.logerror(
-                f"Unknown error! [{str(err)}]",
-                extra={"error_trace": traceback.format_exc()},
+                f"Unknown error! [{str(err)}]", extra={"error_trace": error_trace}
             )
         finally:
             self.result._end_time = timestamps()
@@ -118,9 +134,8 @@ class ProcedureBase(object):
     """
 
     def log(self, msg: str, level: int, *args, **kwargs) -> None:
-        logging.getLogger(f"QACProcedure.{self.name}").log(
-            level=level, msg=_str_(msg), *args, **kwargs
-        )
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, _LazyStr(msg), *args, **kwargs)
 
     def loginfo(self, msg: str, *args, **kwargs) -> None:
         self.log(msg, logging.INFO, *args, **kwargs)
@@ -136,12 +151,19 @@ class ProcedureBase(object):
     """
 
     def acquire_hgcroc(
-        self, tbc: TBController, n_events: int, save_path: str, desc="", **kwargs
+        self,
+        tbc: TBController,
+        n_events: int,
+        save_path: str,
+        desc="",
+        timeout: Optional[float] = None,
+        **kwargs,
     ) -> DataEntry:
         """
         Acquiring n_events data, and store the entry to the the a DataEntry to
         the current results. Additional kwargs will be passed to the
-        construction of the DataEntry
+        construction of the DataEntry. If a timeout (in seconds) is given, a
+        RuntimeError is raised if the acquisition is not complete by then.
         """
 
         # Cast to string required?
@@ -155,31 +177,30 @@ class ProcedureBase(object):
         tbc.daq_socket.configure()
 
         tbc.pull_socket.start()
-        tbc.daq_socket.start()
-        while not tbc.daq_socket.is_complete():
-            tbc.sleep(0.01)
-        tbc.daq_socket.stop()
-        tbc.pull_socket.stop()
-
-        shutil.move(
-            os.path.join("/tmp", "data_aquire0.raw"), self.make_store_path(save_path)
-        )
-        time.sleep(0.1)  # Sleep 100ms for output to be complete
-        self.result.data_files.append(DataEntry(path=save_path, **kwargs))
-        return self.result.last_data
+        try:
+            tbc.daq_socket.start()
+            tbc.daq_socket.wait_complete(timeout=timeout)
+        finally:
+            # Always stopping both sockets so the controller remains usable
+            tbc.daq_socket.stop()
+            tbc.pull_socket.stop()
+
+        raw_path = os.path.join("/tmp", "data_aquire0.raw")
+        wait_file_stable(raw_path)  # Pull client may still be flushing the output
+        move_file(raw_path, self.make_store_path(save_path))
+        data_entry = DataEntry(path=save_path, desc=desc, **kwargs)
+        self.result.data_files.append(data_entry)
+        return data_entry
 
     def save_full_config(self, tbc: TBController, save_path: str, desc="", **kwargs):
         """
         Flushing the current configuration to a file
         """
-        ret = tbc.i2c_socket._config.copy()
-        for key in ret.keys():
-            if key.find("roc_s") == 0:
-                tbc.i2c_socket._config[key] = {"sc": ret[key]}
-        initial_full_config = {}
-        for key, val in tbc.i2c_socket._config.keys():
-            if key.find("roc_s") == 0:
-                initial_full_config[key] = val
+        initial_full_config = {
+            key: {"sc": val}
+            for key, val in tbc.i2c_socket._config.items()
+            if key.startswith("roc_s")
+        }
         initial_full_config["daq"] = tbc.daq_socket._config["daq"]
         initial_full_config["client"] = tbc.pull_socket._config["client"]
 
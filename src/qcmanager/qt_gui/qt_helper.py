@@ -2,7 +2,7 @@ import functools
 import logging
 import time
 import traceback
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from PyQt5.QtCore import QMetaMethod, QObject
 from PyQt5.QtWidgets import (
@@ -18,22 +18,29 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from ..utils import _str_
+from ..utils import _LazyStr, _str_
 from .gui_session import GUISession
 
 
 def clear_layout(layout):
     """
     Clearing the container contents of a layout. As this operation is
-    potentially expensive, use this method sparingly!
+    potentially expensive, use this method sparingly! Nested layouts are
+    handled with an explicit stack rather than recursion.
     """
-    for i in reversed(range(layout.count())):
-        item = layout.itemAt(i)
-        if isinstance(item.widget(), QWidget):
-            item.widget().deleteLater()
-        elif item.layout():
-            clear_layout(item.layout())
-            item.layout().deleteLater()
+    stack = [layout]
+    while stack:
+        current = stack.pop()
+        for i in reversed(range(current.count())):
+            item = current.itemAt(i)
+            widget = item.widget()
+            if isinstance(widget, QWidget):
+                widget.deleteLater()
+                continue
+            sub_layout = item.layout()
+            if sub_layout:
+                stack.append(sub_layout)
+                sub_layout.deleteLater()
 
 
 def get_signal(obj: QObject, signal_name: str):
@@ -62,6 +69,7 @@ class _QContainer(QWidget):
         # set this way
         super().__init__()
         self.session = session  # Reference to main session instance
+        self._logger = logging.getLogger(f"GUI.{self.__class__.__name__}")
 
         # On refresh signals, this wrapper methods ensures that there will not
         # be multiple refreshs being called to the same object. Subsequent
@@ -107,9 +115,8 @@ class _QContainer(QWidget):
         pass
 
     def log(self, s: str, level: int) -> None:
-        logging.getLogger(f"GUI.{self.__class__.__name__}").log(
-            level=level, msg=_str_(s)
-        )
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, _LazyStr(s))
 
     def loginfo(self, s: str) -> None:
         self.log(s, logging.INFO)
@@ -173,14 +180,32 @@ class _QComboPlaceholder(QComboBox):
         self.setEditText("")
         self.lineEdit().setPlaceholderText(self._placeholder)
 
+        # Cached item texts, invalidated whenever the underlying model changes
+        self._item_texts: Optional[List[str]] = None
+        model = self.model()
+        for signal in (
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.dataChanged,
+            model.layoutChanged,
+            model.modelReset,
+        ):
+            signal.connect(self._invalidate_item_texts)
+
+    def _invalidate_item_texts(self, *args) -> None:
+        self._item_texts = None
+
     def set_texts(self, texts: List[str]) -> None:
         self.clear()
         for t in texts:
             self.addItem(t)
 
     @property
-    def item_texts(self):
-        return [self.itemText(i) for i in range(self.count())]
+    def item_texts(self) -> List[str]:
+        if self._item_texts is None:
+            self._item_texts = [self.itemText(i) for i in range(self.count())]
+        return self._item_texts
 
     def on_textchange(self, f: Callable):
         """Short hand"""
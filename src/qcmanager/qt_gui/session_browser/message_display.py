@@ -1,11 +1,14 @@
 import collections
 import datetime
+import functools
+import heapq
 import logging
 import math
-from typing import Dict, Iterable, List, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
 
 import tqdm
-from PyQt5.QtCore import QAbstractTableModel, QObject, Qt, pyqtSignal
+from PyQt5.QtCore import QAbstractTableModel, QObject, Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QDialog,
@@ -34,20 +37,19 @@ class _QSignalTQDM(QObject):
 
     class _WrapTQDM(tqdm.tqdm):
         def __init__(self, signal, *args, **kwargs):
-            super().__init__(*args, **kwargs)
+            # Must be set before the tqdm initialization, which calls refresh
             self._signal = signal
-
-        def update(self, n=1):
-            super().update(n)
-            self._signal.progress.emit(self.n)
+            super().__init__(*args, **kwargs)
 
         """
-        Disabling the CLI display function, to not litter the command line
-        output
+        Replacing the CLI display function with the progress signal emission,
+        to not litter the command line output. tqdm only refreshes once the
+        miniters and mininterval conditions are met, so this also throttles
+        the signals sent from the worker thread.
         """
 
-        def refresh(self, no_lock=False, lock_args=None):
-            return
+        def refresh(self, nolock=False, lock_args=None):
+            self._signal.progress.emit(self.n)
 
         def close(self):
             return
@@ -96,9 +98,19 @@ class _QPBarHandler:
     bar as a work around. (Can we properly fix this??)
     """
 
-    def __init__(self, session: GUISession, foreground="#8888FF", background="#888888"):
+    SHEET_TEMPLATE = "background: qlineargradient(x1:0, x2:1, {stops})"
+
+    def __init__(
+        self,
+        session: GUISession,
+        foreground="#8888FF",
+        background="#888888",
+        release: Optional[Callable[[], None]] = None,
+    ):
         # For global signal parsing
         self.session = session
+        # Called once a connected signal has been cleared
+        self.release = release
         # Display elements - These should be initialized elsewhere to ensure
         # that they can be passed around different threads
         self.desc_label = QLabel("")
@@ -106,6 +118,9 @@ class _QPBarHandler:
         self.stat_label = QLabel("")
         self.foreground = foreground
         self.background = background
+        # Last style sheet set to the progress bar, to avoid reapplying the
+        # same sheet on every update
+        self._bar_sheet: str = ""
         # Pointer objects to the signals generators
         self.signal: Optional[_QSignalTQDM] = None
         self.tqdm: Optional[_QSignalTQDM._WrapTQDM] = None
@@ -139,20 +154,26 @@ class _QPBarHandler:
     @_QContainer.gui_action
     def progress(self, n: int):
         # Setting the main graphical elements
-        format_dict = {k: v for k, v in self.tqdm.format_dict.items()}
+        format_dict = self.tqdm.format_dict  # Fresh dictionary on each call
         format_dict["ncols"] = 0  # Length 0 for only stat bar
         format_dict["prefix"] = ""
         self.stat_label.setText(self.tqdm.format_meter(**format_dict))
 
-        # Setting up the gradient style sheel
+        # Setting up the gradient style sheel. Gradient stops are rounded to
+        # the displayed precision so that the sheet is only reparsed by Qt when
+        # the displayed bar actually changes.
         percent = n / self.tqdm.total
-        template = "background: qlineargradient(x1:0, x2:1, {stops})"
-        stops = [(0, self.foreground), (percent, self.foreground), (1, self.background)]
-        if percent != 1:
-            stops.insert(2, (math.nextafter(percent, 1), self.background))
+        stop = round(percent, 3)
+        stops = [(0, self.foreground), (stop, self.foreground), (1, self.background)]
+        if stop != 1:
+            stops.insert(2, (math.nextafter(stop, 1), self.background))
         cast = lambda x: f"stop: {x[0]} {x[1]}"
-        sheet = template.format(stops=",".join([cast(x) for x in stops]))
-        self.progress_bar.setStyleSheet(sheet)
+        sheet = _QPBarHandler.SHEET_TEMPLATE.format(
+            stops=",".join([cast(x) for x in stops])
+        )
+        if sheet != self._bar_sheet:
+            self._bar_sheet = sheet
+            self.progress_bar.setStyleSheet(sheet)
         self.progress_bar.setText(f"{n}/{self.tqdm.total}  [{percent*100:.1f}%]")
 
     @_QContainer.gui_action
@@ -163,6 +184,7 @@ class _QPBarHandler:
         self.progress_bar.setText("")
         self.progress_bar.setFont(self.make_font(size=1))
         self.progress_bar.setStyleSheet("")
+        self._bar_sheet = ""
         self.stat_label.setText("")
         self.stat_label.setFont(self.make_font(size=1))
         self.stat_label.setStyleSheet("")
@@ -171,6 +193,8 @@ class _QPBarHandler:
             self.signal.clear.disconnect()
             self.signal.deleteLater()
             self.signal = None
+            if self.release is not None:
+                self.release()
 
     @classmethod
     def make_font(cls, size=None):
@@ -187,9 +211,36 @@ class _QPBarHandler:
 class _QLabelHandler(logging.Handler):
     """
     Simpler handler for showing just the latest messages for specific types to
-    targeted QLabels.
+    targeted QLabels. Because the records can be emitted from procedure
+    threads, the label updates are relayed to the GUI thread, where only the
+    latest message of each label is displayed once the update interval has
+    passed.
     """
 
+    class _Relay(QObject):
+        # Labels are passed by role name, plain strings can always be queued
+        message = pyqtSignal(str, str)
+
+        def __init__(self, labels: Dict[str, QLabel], interval: int):
+            super().__init__()
+            self._labels = labels
+            self._pending: Dict[str, str] = {}
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(interval)
+            self._timer.timeout.connect(self._commit)
+            self.message.connect(self._store)
+
+        def _store(self, role: str, text: str):
+            self._pending[role] = text
+            if not self._timer.isActive():
+                self._timer.start()
+
+        def _commit(self):
+            for role, text in self._pending.items():
+                self._labels[role].setText(text)
+            self._pending.clear()
+
     def __init__(
         self,
         info_label: Optional[QLabel] = None,
@@ -197,6 +248,7 @@ class _QLabelHandler(logging.Handler):
         error_label: Optional[QLabel] = None,
         misc_label: Optional[QLabel] = None,
         level: int = logging.NOTSET,
+        interval: int = 50,  # Update interval in milliseconds
     ):
         super().__init__(level=level)
         self.info_label = info_label
@@ -204,23 +256,34 @@ class _QLabelHandler(logging.Handler):
         self.error_label = error_label
         self.misc_label = misc_label
 
-        # Simple map to determine which display element to use
+        # Display elements by role, and simple map to determine which role to
+        # use for a given level
+        self.__labels__ = {
+            role: label
+            for role, label in [
+                ("info", self.info_label),
+                ("warn", self.warn_label),
+                ("error", self.error_label),
+                ("misc", self.misc_label),
+            ]
+            if label is not None
+        }
         self.__level_map__ = {
-            logging.INFO: self.info_label,
-            logging.WARN: self.warn_label,
-            logging.ERROR: self.error_label,
+            logging.INFO: "info",
+            logging.WARN: "warn",
+            logging.ERROR: "error",
         }
+        self._relay = _QLabelHandler._Relay(self.__labels__, interval)
 
     def emit(self, record: logging.LogRecord):
-        level = record.levelno
-        label = None
-        if level in self.__level_map__:
-            label = self.__level_map__[level]
-        if label is None:
-            label = self.misc_label
-        if label is not None:
+        role = self.__level_map__.get(record.levelno, "misc")
+        if role not in self.__labels__:
+            role = "misc"
+        if role in self.__labels__:
             time_str = timestampg(datetime.datetime.fromtimestamp(record.created))
-            label.setText(f"[{time_str}] {record.name}:{record.msg}")
+            self._relay.message.emit(
+                role, f"[{time_str}] {record.name}:{record.getMessage()}"
+            )
 
 
 class MemHandle(logging.Handler):
@@ -250,8 +313,15 @@ class SessionMessageDisplay(_QContainer):
         self.program_error = QLabel("")
         self.program_misc = QLabel("")
 
+        # Heap of the indices of handlers not connected to any progress signal,
+        # so that the first free handler is always used
+        self._free_slots: List[int] = list(range(6))
+        self._free_lock = threading.Lock()
         self.progress_handlers: List[_QPBarHandler] = [
-            _QPBarHandler(self.session) for _ in range(6)
+            _QPBarHandler(
+                self.session, release=functools.partial(self._release_slot, index)
+            )
+            for index in range(6)
         ]  # Will never need for than 6 progress bars?
 
         self.__init_layout__()
@@ -326,13 +396,17 @@ class SessionMessageDisplay(_QContainer):
         """
         tqdm_instance = _QSignalTQDM(self.session, iterable, *args, **kwargs)
 
-        for handler in self.progress_handlers:
-            if not handler.in_use:
-                handler.connect(tqdm_instance)
-                break
+        with self._free_lock:
+            index = heapq.heappop(self._free_slots) if self._free_slots else None
+        if index is not None:
+            self.progress_handlers[index].connect(tqdm_instance)
         # TODO: What should be done if more than 6 progress bars are spawned??
         return tqdm_instance
 
+    def _release_slot(self, index: int):
+        with self._free_lock:
+            heapq.heappush(self._free_slots, index)
+
     def show_full_message_log(self, event=None):
         dialog = _QLogDisplay(self.memhandle._log)
         dialog.exec()
@@ -346,7 +420,7 @@ class _QLogDisplay(QDialog):
                 record.name.replace("QCAProcedure.", ""),
                 timestampg(datetime.datetime.fromtimestamp(record.created)),
                 record.levelno,  # Better parsing?
-                record.msg,
+                record.getMessage(),
             ]
 
         def __init__(self, log_entries: Dict[int, Iterable[logging.LogRecord]]):
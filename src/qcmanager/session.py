@@ -1,16 +1,72 @@
-import inspect
+import collections.abc
 import os
-from typing import Any, Iterable, List, Optional, Type
+import textwrap
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import tqdm
-import yaml
 
 from .hw import TBController
 from .procedures._procedure_base import HWIterable, ProcedureBase
-from .utils import _str_, to_yaml
+from .utils import _str_, from_yaml, to_yamls
 from .yaml_format import ProcedureResult
 
 
+# Session attributes used to fill procedure interfaces of known types
+_INTERFACE_ATTR_MAP = {
+    HWIterable: "iterate",
+    TBController: "tb_controller",
+    List[ProcedureResult]: "results",
+}
+
+
+def _yaml_list_entry(obj) -> str:
+    """
+    YAML string of an object as a block sequence entry. Concatenating these
+    entries gives the same output as dumping the list of objects.
+    """
+    return "- " + textwrap.indent(to_yamls(obj), "  ")[2:]
+
+
+class _LazyResultList(collections.abc.MutableSequence):
+    """
+    List of procedure results loaded from a session file. The stored
+    dictionaries are only converted to ProcedureResult objects when they are
+    first accessed.
+    """
+
+    def __init__(self, entries: Iterable[Union[Dict[str, Any], ProcedureResult]]):
+        self._entries = list(entries)
+
+    def _convert(self, index: int) -> ProcedureResult:
+        entry = self._entries[index]
+        if isinstance(entry, dict):
+            # from_dict modifies its input, the stored entry is kept unchanged
+            entry = ProcedureResult.from_dict(dict(entry))
+            self._entries[index] = entry
+        return entry
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._convert(i) for i in range(len(self._entries))[index]]
+        return self._convert(index)
+
+    def __setitem__(self, index, value):
+        self._entries[index] = value
+
+    def __delitem__(self, index):
+        del self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, index, value):
+        self._entries.insert(index, value)
+
+    def raw_entries(self) -> List[Union[Dict[str, Any], ProcedureResult]]:
+        """Stored entries, without converting the unaccessed dictionaries"""
+        return list(self._entries)
+
+
 class Session(object):
     """
     Main class for handling all logging instances and the various hardware
@@ -38,33 +94,33 @@ class Session(object):
         # Persistence reference to hardware control interfaces
         self.tb_controller: Optional[TBController] = None
 
+        # Cached YAML entries of the results that have already been saved
+        self._results_yaml: List[Tuple[ProcedureResult, str]] = []
+
     @property
     def save_base(self):
         return os.path.join(Session.LOCAL_STORE, f"{self.board_type}.{self.board_id}")
 
     def modify_save_path(self, path):
         return_path = os.path.join(self.save_base, path)
-        if not os.path.exists(os.path.dirname(return_path)):
-            os.mkdir(os.path.dirname(return_path))
+        os.makedirs(os.path.dirname(return_path), exist_ok=True)
         return return_path
 
     def load_yaml(self, filepath: str):
         self.log_file = filepath
         with open(filepath, "r") as f:
-            store_session = yaml.safe_load(f)
+            store_session = from_yaml(f)
             self.board_type = store_session["board_type"]
             self.board_id = store_session["board_id"]
-            self.results = [
-                ProcedureResult.from_dict(x) for x in store_session["results"]
-            ]
+            self.results = _LazyResultList(store_session["results"])
             self.log_file = filepath
 
     def from_blank(self, board_type: str, board_id: str):
         # Checking if directory exists. Create a new directory is it doesn't
         target_path = os.path.join(Session.LOCAL_STORE, f"{board_type}.{board_id}")
-        if not os.path.exists(target_path):
-            os.mkdir(target_path)
-        else:
+        try:
+            os.makedirs(target_path)
+        except FileExistsError:
             raise RuntimeError(
                 _str_(
                     f"""
@@ -81,16 +137,44 @@ class Session(object):
         self.save_session()
 
     def save_session(self):
-        """Flushing results to target file"""
-        with open(self.log_file, "w") as f:
-            to_yaml(
-                {
-                    k: v
-                    for k, v in self.__dict__.items()
-                    if k in ["board_type", "board_id", "results"]
-                },
-                f,
-            )
+        """
+        Flushing results to target file. Only the latest result can still be
+        modified by a running procedure, so the YAML entries of all earlier
+        results are reused from the previous save instead of being serialized
+        again.
+
+        The full content is serialized before anything is written, and the file
+        is replaced atomically, so a failed save never truncates the existing
+        session file.
+        """
+        content = to_yamls({"board_type": self.board_type, "board_id": self.board_id})
+        if len(self.results) == 0:
+            content += "results: []\n"
+        else:
+            content += "results:\n" + "".join(self._results_yaml_entries())
+
+        tmp_file = self.log_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(content)
+        os.replace(tmp_file, self.log_file)
+
+    def _results_yaml_entries(self) -> List[str]:
+        # Loaded results that were never accessed are dumped from their stored
+        # dictionaries, so saving does not convert them
+        results = (
+            self.results.raw_entries()
+            if isinstance(self.results, _LazyResultList)
+            else self.results
+        )
+        n_cached = 0
+        for (cached, _), result in zip(self._results_yaml, results[:-1]):
+            if cached is not result:
+                break
+            n_cached += 1
+        self._results_yaml = self._results_yaml[:n_cached] + [
+            (result, _yaml_list_entry(result)) for result in results[n_cached:]
+        ]
+        return [entry for _, entry in self._results_yaml]
 
     def detect_procedure_interface(self, method_class: ProcedureBase) -> List[Any]:
         """
@@ -99,22 +183,11 @@ class Session(object):
         """
 
         def _get_interface(int_name: str, int_type: Type) -> Any:
-            __type_map__ = {
-                HWIterable: self.iterate,
-                TBController: self.tb_controller,
-                List[ProcedureResult]: self.results,
-            }
-            if int_type in __type_map__:
-                return __type_map__.get(int_type)
-            else:
-                return getattr(self, int_name)
+            return getattr(self, _INTERFACE_ATTR_MAP.get(int_type, int_name))
 
         return [
-            _get_interface(param_name, param.annotation)
-            for param_name, param in inspect.signature(
-                method_class.run
-            ).parameters.items()
-            if param_name != "self"
+            _get_interface(param_name, param_type)
+            for param_name, param_type in method_class._run_param_specs
         ]
 
     def iterate(self, x: Iterable, *args, **kwargs):
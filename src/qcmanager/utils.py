@@ -1,10 +1,22 @@
 import collections
 import datetime
+import errno
 import io
+import os
+import shutil
+import time
 from typing import Any, Dict, Optional
 
 import yaml
 
+# Using the libyaml bindings if PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper
+    from yaml import SafeLoader as _YAMLLoader
+
 
 def _str_(s: str) -> str:
     """
@@ -14,6 +26,25 @@ def _str_(s: str) -> str:
     return " ".join(s.split())
 
 
+class _LazyStr:
+    """
+    Deferring the _str_ conversion of a log message until the message is
+    actually formatted by a handler. The converted string is kept for handlers
+    that format the same record again.
+    """
+
+    __slots__ = ("_raw", "_str")
+
+    def __init__(self, s: str):
+        self._raw = s
+        self._str: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = _str_(self._raw)
+        return self._str
+
+
 def _to_dict(obj) -> Dict[str, Any]:
     """
     Casting a dataclass object to plain python dictionary representation.
@@ -25,6 +56,8 @@ def _to_dict(obj) -> Dict[str, Any]:
             return entry
         elif isinstance(entry, collections.abc.Mapping):
             return {k: convert_entry(v) for k, v in entry.items()}
+        elif hasattr(entry, "tolist"):  # numpy arrays and scalars
+            return convert_entry(entry.tolist())
         elif isinstance(entry, collections.abc.Iterable):
             # Always cast to list
             return list(convert_entry(x) for x in entry)
@@ -41,7 +74,7 @@ def _to_dict(obj) -> Dict[str, Any]:
 
 def to_yamls(obj) -> str:
     """Dumping object to yaml string"""
-    return yaml.dump(_to_dict(obj), default_flow_style=False)
+    return yaml.dump(_to_dict(obj), Dumper=_YAMLDumper, default_flow_style=False)
 
 
 def to_yaml(obj, f: io.TextIOWrapper) -> None:
@@ -49,6 +82,45 @@ def to_yaml(obj, f: io.TextIOWrapper) -> None:
     f.write(to_yamls(obj))
 
 
+def from_yaml(f: io.TextIOWrapper) -> Any:
+    """Reading plain python objects from a YAML I/O pointer"""
+    return yaml.load(f, Loader=_YAMLLoader)
+
+
+def wait_file_stable(path: str, interval: float = 0.02, timeout: float = 5.0) -> None:
+    """
+    Waiting until the file exists and its size has not changed over one check
+    interval, for files that are written by external processes. Raises a
+    RuntimeError if the file does not settle within timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    last_size = -1
+    while True:
+        size = os.stat(path).st_size if os.path.exists(path) else -1
+        if size >= 0 and size == last_size:
+            return
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"File [{path}] not complete after {timeout} seconds")
+        last_size = size
+        time.sleep(interval)
+
+
+def move_file(src: str, dst: str) -> None:
+    """
+    Moving a file with an atomic rename. If the source and destination are on
+    different file systems, the file is copied with shutil.copyfile (which uses
+    in-kernel copies such as sendfile where available) before the source is
+    removed.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(src, dst)
+        os.remove(src)
+
+
 def get_datetime() -> datetime.datetime:
     """Return the current datetime item"""
     return datetime.datetime.now()
@@ -0,0 +1,85 @@
+import pytest
+
+from qcmanager.session import Session
+from qcmanager.utils import to_yamls
+from qcmanager.yaml_format import DataEntry, ProcedureResult, SingularResult
+
+
+def make_result(index: int) -> ProcedureResult:
+    result = ProcedureResult(
+        name=f"procedure{index}",
+        _start_time="2024-01-01T00:00:00",
+        _end_time="2024-01-01T00:01:00",
+        input={"n_events": index, "desc": "multi\nline"},
+        status_code=(0, ""),
+    )
+    result.data_files.append(DataEntry(path=f"data{index}.txt", desc="data"))
+    result.board_summary = SingularResult(0, "SUCCESS", channel=SingularResult.BOARD)
+    result.channel_summary = [SingularResult(0, "SUCCESS", channel=c) for c in [0, 1]]
+    return result
+
+
+def full_dump(session: Session) -> str:
+    return to_yamls(
+        {
+            "board_type": session.board_type,
+            "board_id": session.board_id,
+            "results": session.results,
+        }
+    )
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(Session, "LOCAL_STORE", str(tmp_path))
+    session = Session()
+    session.from_blank("1234", "5678")
+    return session
+
+
+def test_incremental_save(session):
+    with open(session.log_file) as f:
+        assert f.read() == full_dump(session)
+
+    for index in range(3):
+        session.results.append(make_result(index))
+        session.save_session()
+        # Latest result is modified after the initial save
+        session.results[-1].status_code = (1, "modified")
+        session.save_session()
+        with open(session.log_file) as f:
+            assert f.read() == full_dump(session)
+
+
+def test_load_save_roundtrip(session):
+    for index in range(3):
+        session.results.append(make_result(index))
+    session.save_session()
+    with open(session.log_file) as f:
+        saved = f.read()
+
+    loaded = Session()
+    loaded.load_yaml(session.log_file)
+    loaded.save_session()
+    with open(session.log_file) as f:
+        assert f.read() == saved
+    # Saving should not convert the loaded entries
+    assert all(isinstance(x, dict) for x in loaded.results.raw_entries())
+
+    assert len(loaded.results) == 3
+    assert loaded.results[1].input == session.results[1].input
+    assert loaded.results[1].data_files[0].path == "data1.txt"
+
+
+def test_failed_save_keeps_file(session):
+    session.results.append(make_result(0))
+    session.save_session()
+    with open(session.log_file) as f:
+        saved = f.read()
+
+    session.results.append(make_result(1))
+    session.results[-1].input["bad"] = object()
+    with pytest.raises(Exception):
+        session.save_session()
+    with open(session.log_file) as f:
+        assert f.read() == saved